@@ -3,40 +3,108 @@
 
 import argparse
 import json
-import io
-import re
 import sys
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple, Any
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
 
 import cmd2
 from cmd2 import (
-    Cmd, 
     Cmd2ArgumentParser, 
     CompletionError, 
-    CompletionItem, 
-    ansi,
     with_argparser,
     with_category
 )
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
-from .config import SCMConfig, load_oauth_credentials
+from .config import load_oauth_credentials
 from .db import CLIHistoryDB
-from .mock_sdk import AddressObjectType, AuthenticationError  # Import from actual panscm when available
+from .mock_sdk import AuthenticationError  # Import from actual panscm when available
 from .sdk_client import (
     APIError,
     AddressObject,
+    ResourceAlreadyExistsError,
     ResourceNotFoundError,
     SDKClient,
     ValidationError,
 )
 
+# rich.syntax is only needed to show an object as JSON, so it is imported
+# there; cmd2 already imports the other rich modules and json at startup
+if TYPE_CHECKING:
+    from rich.syntax import SyntaxTheme
+
+
+# Folders offered for completion before any have been visited
+STANDARD_FOLDERS = ("Global", "Shared", "Texas", "California", "New_York")
+
+
+class NameIndex:
+    """Set of names kept in sorted order for fast prefix completion."""
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        """Initialize the index.
+
+        Args:
+            names: Initial names to index
+        """
+        self._members: Set[str] = set(names)
+        self._sorted: List[str] = sorted(self._members)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sorted)
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def add(self, name: str) -> None:
+        """Add a name to the index."""
+        if name not in self._members:
+            self._members.add(name)
+            insort(self._sorted, name)
+
+    def update(self, names: Iterable[str]) -> None:
+        """Add several names to the index."""
+        new_names = set(names) - self._members
+        if new_names:
+            self._members |= new_names
+            self._sorted = sorted(self._members)
+
+    def discard(self, name: str) -> None:
+        """Remove a name from the index if present."""
+        if name in self._members:
+            self._members.remove(name)
+            del self._sorted[bisect_left(self._sorted, name)]
+
+    def complete(self, prefix: str) -> List[str]:
+        """Return the indexed names starting with prefix, in sorted order.
+
+        Args:
+            prefix: The text typed so far
+
+        Returns:
+            Matching names
+        """
+        if not prefix:
+            return list(self._sorted)
+
+        names = self._sorted
+        matches = []
+        for i in range(bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            matches.append(names[i])
+        return matches
+
 
 @dataclass
 class SCMState:
@@ -48,13 +116,176 @@ class SCMState:
     client_id: Optional[str] = None
     username: Optional[str] = None
     # Track folders we've seen for autocompletion
-    known_folders: Set[str] = field(default_factory=set)
+    known_folders: NameIndex = field(default_factory=lambda: NameIndex(STANDARD_FOLDERS))
     # Track address objects we've seen for autocompletion
-    known_address_objects: Dict[str, Set[str]] = field(default_factory=dict)
+    known_address_objects: DefaultDict[str, NameIndex] = field(
+        default_factory=lambda: defaultdict(NameIndex)
+    )
     # History database
     history_db: CLIHistoryDB = field(default_factory=lambda: CLIHistoryDB())
 
 
+# Contextual help for "?", keyed by (command, number of words typed, second
+# word). A depth and second word of None match any context for the command.
+CONTEXTUAL_HELP: Dict[Tuple[str, Optional[int], Optional[str]], str] = {
+    ("set", 1, None): "\n".join([
+        "Available object types:",
+        "  address-object - Configure an address object",
+    ]),
+    ("set", 2, "address-object"): "\n".join([
+        "Syntax: set address-object <name> <type> <value> [description <text>] [tags <tag1,tag2,...>]",
+        "\nRequired arguments:",
+        "  <name>        - Name of the address object",
+        "  <type>        - Type of address object (ip-netmask, ip-range, ip-wildcard, fqdn)",
+        "  <value>       - Value of the address object",
+        "\nOptional arguments:",
+        "  description   - Description of the address object",
+        "  tags          - Comma-separated list of tags",
+    ]),
+    ("set", 3, "address-object"): "\n".join([
+        "Address object types:",
+        "  ip-netmask  - IP address with netmask (e.g., 192.168.1.0/24)",
+        "  ip-range    - IP address range (e.g., 192.168.1.1-192.168.1.10)",
+        "  ip-wildcard - IP address with wildcard mask (e.g., 192.168.1.0/0.0.0.255)",
+        "  fqdn        - Fully qualified domain name (e.g., example.com)",
+    ]),
+    ("set", 4, "address-object"): "\n".join([
+        "Enter the value for the address object based on its type:",
+        "  ip-netmask  - e.g., 192.168.1.0/24",
+        "  ip-range    - e.g., 192.168.1.1-192.168.1.10",
+        "  ip-wildcard - e.g., 192.168.1.0/0.0.0.255",
+        "  fqdn        - e.g., example.com",
+    ]),
+    ("set", 5, "address-object"): "\n".join([
+        "Optional arguments:",
+        "  description <text>  - Add a description to the address object",
+        "  tags <tag1,tag2,..> - Add tags to the address object",
+    ]),
+    ("show", 1, None): "\n".join([
+        "Available objects to show:",
+        "  address-object         - Show details of a specific address object",
+        "  address-objects        - Show all address objects in the current folder",
+        "  address-objects-filter - Search and filter address objects",
+    ]),
+    ("show", 2, "address-object"): "\n".join([
+        "Syntax: show address-object <name>",
+        "\nArguments:",
+        "  <name> - Name of the address object to show",
+    ]),
+    ("show", 2, "address-objects-filter"): "\n".join([
+        "Syntax: show address-objects-filter [--name <substring>] [--type <type>] [--value <substring>] [--tag <substring>]",
+        "\nFilter options:",
+        "  --name <substring>  - Filter by name (substring match)",
+        "  --type <type>       - Filter by type (exact match, one of: ip-netmask, ip-range, ip-wildcard, fqdn)",
+        "  --value <substring> - Filter by value (substring match)",
+        "  --tag <substring>   - Filter by tag (substring match)",
+        "\nExamples:",
+        "  show address-objects-filter --name web        # Find objects with 'web' in the name",
+        "  show address-objects-filter --type fqdn       # Show only FQDN objects",
+        "  show address-objects-filter --value 192.168   # Find objects with value containing '192.168'",
+        "  show address-objects-filter --tag prod        # Find objects with 'prod' in any tag",
+    ]),
+    ("delete", 1, None): "\n".join([
+        "Available objects to delete:",
+        "  address-object - Delete an address object",
+    ]),
+    ("delete", 2, "address-object"): "\n".join([
+        "Syntax: delete address-object <name>",
+        "\nArguments:",
+        "  <name> - Name of the address object to delete",
+    ]),
+    ("edit", 1, None): "\n".join([
+        "Available objects to edit:",
+        "  folder - Edit a specific folder",
+    ]),
+    ("edit", 2, "folder"): "\n".join([
+        "Syntax: edit folder <name>",
+        "\nArguments:",
+        "  <name> - Name of the folder to edit",
+    ]),
+    ("history", None, None): "\n".join([
+        "Syntax: history [--page <name>] [--limit <name>] [--folder <folder>] [--filter <text>] [--clear] [--id <name>]",
+        "\nOptions:",
+        "  --page <name>       - Page number to display, starting from 1 (default: 1)",
+        "  --limit <name>      - Maximum number of history entries to show per page (default: 50)",
+        "  --folder <folder> - Filter history by folder",
+        "  --filter <text>   - Filter history by command content",
+        "  --clear           - Clear command history",
+        "  --id <name>         - Show details of a specific history entry",
+        "\nExamples:",
+        "  history                     # Show last 50 commands",
+        "  history --page 2            # Show second page of commands",
+        "  history --limit 20          # Show only 20 commands per page",
+        "  history --folder Texas      # Show commands from the Texas folder",
+        "  history --filter address    # Show commands containing 'address'",
+        "  history --id 5              # Show details of history entry #5",
+        "  history --clear             # Clear all command history",
+    ]),
+}
+
+# Map CLI address types to SDK types and back
+CLI_TO_SDK_TYPE: Dict[str, str] = {
+    "ip-netmask": "ip",
+    "ip-range": "range",
+    "ip-wildcard": "wildcard",
+    "fqdn": "fqdn",
+}
+SDK_TO_CLI_TYPE: Dict[str, str] = {v: k for k, v in CLI_TO_SDK_TYPE.items()}
+ADDRESS_TYPES: Tuple[str, ...] = tuple(CLI_TO_SDK_TYPE)
+ADDRESS_TYPES_STR = ", ".join(ADDRESS_TYPES)
+
+
+def _parse_tags(value: str) -> List[str]:
+    """Parse a comma-separated list of tags."""
+    return [tag.strip() for tag in value.split(",")]
+
+
+# Parsers for the optional keyword arguments of set address-object
+ADDRESS_KEYWORD_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "description": str,
+    "tags": _parse_tags,
+}
+
+
+@lru_cache(maxsize=1)
+def _json_theme() -> "SyntaxTheme":
+    """Return the shared theme used to highlight JSON output.
+    
+    Reusing one theme instance also reuses its cache of resolved token styles.
+    """
+    from rich.syntax import Syntax
+
+    return Syntax.get_theme("monokai")
+
+
+@lru_cache(maxsize=64)
+def _build_prompt(username: str, config_mode: bool, folder: Optional[str]) -> str:
+    """Build the prompt for a CLI state, reusing strings built before.
+    
+    Args:
+        username: Name of the current user
+        config_mode: Whether configuration mode is active
+        folder: Folder being edited, if any
+        
+    Returns:
+        The prompt string
+    """
+    if config_mode:
+        if folder:
+            return f"{username}({folder})# "
+        return f"{username}@scm# "
+    return f"{username}@scm> "
+
+
+# Seconds an address completion list fetched from the SDK is reused
+ADDRESS_COMPLETION_TTL = 30.0
+
+# Built-in cmd2 commands that are not available in the SCM CLI
+DISABLED_COMMANDS = frozenset(
+    {"alias", "macro", "run_pyscript", "run_script", "shell", "shortcuts"}
+)
+HIDDEN_COMMANDS = DISABLED_COMMANDS | {"py", "ipy"}
+
 # Command categories
 CATEGORY_CONFIG = "Configuration Commands"
 CATEGORY_ADDRESS = "Address Object Commands"
@@ -65,8 +296,19 @@ CATEGORY_HISTORY = "History Commands"
 class SCMCLI(cmd2.Cmd):
     """SCM CLI command processor using cmd2."""
 
-    def __init__(self) -> None:
-        """Initialize the SCM CLI command processor."""
+    def __init__(self, console: Optional[Console] = None) -> None:
+        """Initialize the SCM CLI command processor.
+        
+        Args:
+            console: Rich console to write output to, a new one is created if omitted
+        """
+        # Command names are fixed by the class, so compute them once. This must
+        # happen before cmd2 initializes because it calls get_all_commands().
+        self._command_set = frozenset(
+            name[3:] for name in dir(self) if name.startswith("do_")
+        )
+        self._command_list = sorted(self._command_set)
+
         super().__init__(
             allow_cli_args=False,
             allow_redirection=False,
@@ -75,19 +317,27 @@ class SCMCLI(cmd2.Cmd):
         
         # Configure cmd2 settings
         self.self_in_help = False
-        self.hidden_commands += ['alias', 'macro', 'run_pyscript', 'run_script', 'shell', 'shortcuts', 'py', 'ipy']
+        self.hidden_commands += sorted(HIDDEN_COMMANDS)
         self.default_to_shell = False
         
         # Disable commands if they exist
-        for cmd_name in ['alias', 'macro', 'run_pyscript', 'run_script', 'shell', 'shortcuts']:
-            if hasattr(self, f'do_{cmd_name}'):
-                self.disable_command(cmd_name, "Command not available")
+        for cmd_name in DISABLED_COMMANDS & self._command_set:
+            self.disable_command(cmd_name, "Command not available")
         
         # Initialize state
         self.state = SCMState()
         
+        # When each folder's address names were last fetched for completion
+        self._address_fetch_times: Dict[str, float] = {}
+        
+        # Last ID on each history page shown, keyed by (folder, filter, limit,
+        # page), so the following page can seek past it; reset when history
+        # changes here, or when the data version shows another session wrote
+        self._history_page_ends: Dict[Tuple[Optional[str], Optional[str], int, int], int] = {}
+        self._history_data_version: Optional[int] = None
+        
         # Rich console
-        self.console = Console()
+        self.console = console or Console()
         
         # Initialize SDK client
         self._initialize_sdk()
@@ -121,6 +371,7 @@ class SCMCLI(cmd2.Cmd):
                 folder=self.state.current_folder,
                 success=True
             )
+            self._history_page_ends.clear()
             
         return super().postcmd(stop, statement)
         
@@ -137,11 +388,9 @@ class SCMCLI(cmd2.Cmd):
             return "user"
             
         # Extract everything before the first @ symbol
-        match = re.match(r"^([^@]+)@?.*$", client_id)
-        if match:
-            return match.group(1)
-        
-        return client_id
+        username = client_id.split("@", 1)[0]
+
+        return username or client_id
 
     def _initialize_sdk(self) -> None:
         """Initialize SDK client from OAuth credentials."""
@@ -185,15 +434,11 @@ class SCMCLI(cmd2.Cmd):
 
     def update_prompt(self) -> None:
         """Update the prompt based on the current state."""
-        username = self.state.username or "user"
-        
-        if self.state.config_mode:
-            if self.state.current_folder:
-                self.prompt = f"{username}({self.state.current_folder})# "
-            else:
-                self.prompt = f"{username}@scm# "
-        else:
-            self.prompt = f"{username}@scm> "
+        self.prompt = _build_prompt(
+            self.state.username or "user",
+            self.state.config_mode,
+            self.state.current_folder,
+        )
 
     def emptyline(self) -> bool:
         """Do nothing on empty line."""
@@ -239,102 +484,17 @@ class SCMCLI(cmd2.Cmd):
             self.do_help("")
             return
             
-        # Help for set command
-        elif cmd == "set":
-            if len(context) == 1:
-                self.console.print("Available object types:")
-                self.console.print("  address-object - Configure an address object")
-            elif len(context) == 2 and context[1] == "address-object":
-                self.console.print("Syntax: set address-object <name> <type> <value> [description <text>] [tags <tag1,tag2,...>]")
-                self.console.print("\nRequired arguments:")
-                self.console.print("  <name>        - Name of the address object")
-                self.console.print("  <type>        - Type of address object (ip-netmask, ip-range, ip-wildcard, fqdn)")
-                self.console.print("  <value>       - Value of the address object")
-                self.console.print("\nOptional arguments:")
-                self.console.print("  description   - Description of the address object")
-                self.console.print("  tags          - Comma-separated list of tags")
-            elif len(context) == 3 and context[1] == "address-object":
-                self.console.print("Address object types:")
-                self.console.print("  ip-netmask  - IP address with netmask (e.g., 192.168.1.0/24)")
-                self.console.print("  ip-range    - IP address range (e.g., 192.168.1.1-192.168.1.10)")
-                self.console.print("  ip-wildcard - IP address with wildcard mask (e.g., 192.168.1.0/0.0.0.255)")
-                self.console.print("  fqdn        - Fully qualified domain name (e.g., example.com)")
-            elif len(context) == 4 and context[1] == "address-object":
-                self.console.print("Enter the value for the address object based on its type:")
-                self.console.print("  ip-netmask  - e.g., 192.168.1.0/24")
-                self.console.print("  ip-range    - e.g., 192.168.1.1-192.168.1.10")
-                self.console.print("  ip-wildcard - e.g., 192.168.1.0/0.0.0.255")
-                self.console.print("  fqdn        - e.g., example.com")
-            elif len(context) >= 5 and context[1] == "address-object":
-                if len(context) == 5 or (len(context) > 5 and context[5] not in ["description", "tags"]):
-                    self.console.print("Optional arguments:")
-                    self.console.print("  description <text>  - Add a description to the address object")
-                    self.console.print("  tags <tag1,tag2,..> - Add tags to the address object")
-                
-        # Help for show command
-        elif cmd == "show":
-            if len(context) == 1:
-                self.console.print("Available objects to show:")
-                self.console.print("  address-object         - Show details of a specific address object")
-                self.console.print("  address-objects        - Show all address objects in the current folder")
-                self.console.print("  address-objects-filter - Search and filter address objects")
-            elif len(context) == 2 and context[1] == "address-object":
-                self.console.print("Syntax: show address-object <name>")
-                self.console.print("\nArguments:")
-                self.console.print("  <name> - Name of the address object to show")
-            elif len(context) == 2 and context[1] == "address-objects-filter":
-                self.console.print("Syntax: show address-objects-filter [--name <substring>] [--type <type>] [--value <substring>] [--tag <substring>]")
-                self.console.print("\nFilter options:")
-                self.console.print("  --name <substring>  - Filter by name (substring match)")
-                self.console.print("  --type <type>       - Filter by type (exact match, one of: ip-netmask, ip-range, ip-wildcard, fqdn)")
-                self.console.print("  --value <substring> - Filter by value (substring match)")
-                self.console.print("  --tag <substring>   - Filter by tag (substring match)")
-                self.console.print("\nExamples:")
-                self.console.print("  show address-objects-filter --name web        # Find objects with 'web' in the name")
-                self.console.print("  show address-objects-filter --type fqdn       # Show only FQDN objects")
-                self.console.print("  show address-objects-filter --value 192.168   # Find objects with value containing '192.168'")
-                self.console.print("  show address-objects-filter --tag prod        # Find objects with 'prod' in any tag")
-                
-        # Help for delete command
-        elif cmd == "delete":
-            if len(context) == 1:
-                self.console.print("Available objects to delete:")
-                self.console.print("  address-object - Delete an address object")
-            elif len(context) == 2 and context[1] == "address-object":
-                self.console.print("Syntax: delete address-object <name>")
-                self.console.print("\nArguments:")
-                self.console.print("  <name> - Name of the address object to delete")
-                
-        # Help for edit command
-        elif cmd == "edit":
-            if len(context) == 1:
-                self.console.print("Available objects to edit:")
-                self.console.print("  folder - Edit a specific folder")
-            elif len(context) == 2 and context[1] == "folder":
-                self.console.print("Syntax: edit folder <name>")
-                self.console.print("\nArguments:")
-                self.console.print("  <name> - Name of the folder to edit")
-        
-        # Help for history command
-        elif cmd == "history":
-            self.console.print("Syntax: history [--page <name>] [--limit <name>] [--folder <folder>] [--filter <text>] [--clear] [--id <name>]")
-            self.console.print("\nOptions:")
-            self.console.print("  --page <name>       - Page number to display, starting from 1 (default: 1)")
-            self.console.print("  --limit <name>      - Maximum number of history entries to show per page (default: 50)")
-            self.console.print("  --folder <folder> - Filter history by folder")
-            self.console.print("  --filter <text>   - Filter history by command content")
-            self.console.print("  --clear           - Clear command history")
-            self.console.print("  --id <name>         - Show details of a specific history entry")
-            self.console.print("\nExamples:")
-            self.console.print("  history                     # Show last 50 commands")
-            self.console.print("  history --page 2            # Show second page of commands")
-            self.console.print("  history --limit 20          # Show only 20 commands per page")
-            self.console.print("  history --folder Texas      # Show commands from the Texas folder")
-            self.console.print("  history --filter address    # Show commands containing 'address'")
-            self.console.print("  history --id 5              # Show details of history entry #5")
-            self.console.print("  history --clear             # Clear all command history")
-                
-        # General help for other commands
+        depth = len(context)
+        subcommand = context[1] if depth > 1 else None
+        
+        # Optional keyword help applies to any position after the value
+        # until a keyword has been typed
+        if cmd == "set" and depth > 5 and context[5] not in ADDRESS_KEYWORD_PARSERS:
+            depth = 5
+            
+        help_text = CONTEXTUAL_HELP.get((cmd, depth, subcommand)) or CONTEXTUAL_HELP.get((cmd, None, None))
+        if help_text is not None:
+            self.console.print(help_text, markup=False)
         else:
             # Try to get help for the command
             self.do_help(cmd)
@@ -351,12 +511,12 @@ class SCMCLI(cmd2.Cmd):
             command = statement.raw.strip()[:-1].strip()
             
             # Check if it's a valid command or starts with a valid command prefix
-            for cmd_name in self.get_all_commands():
-                if command == cmd_name or command.startswith(f"{cmd_name} "):
-                    # Show help for the command
-                    self.do_help(cmd_name)
-                    # Return empty statement to not execute the original command
-                    return cmd2.Statement("")
+            cmd_name = command.split(" ", 1)[0]
+            if cmd_name in self._command_set:
+                # Show help for the command
+                self.do_help(cmd_name)
+                # Return empty statement to not execute the original command
+                return cmd2.Statement("")
             
             # If no matching command is found, show general help
             self.do_help("")
@@ -366,11 +526,7 @@ class SCMCLI(cmd2.Cmd):
 
     def get_all_commands(self) -> List[str]:
         """Get all available command names."""
-        commands = []
-        for name in dir(self):
-            if name.startswith('do_'):
-                commands.append(name[3:])
-        return commands
+        return self._command_list
 
     # Tab completion for folders
     def folder_completer(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
@@ -378,18 +534,8 @@ class SCMCLI(cmd2.Cmd):
         if not self.state.sdk_client:
             raise CompletionError("No SDK client available")
             
-        # Add any folders we already know about
-        completions = list(self.state.known_folders)
-        
-        # Add some standard folders
-        standard_folders = ["Global", "Shared", "Texas", "California", "New_York"]
-        completions.extend(standard_folders)
-        
-        # Return matching folders
-        if text:
-            return [f for f in completions if f.startswith(text)]
-        else:
-            return completions
+        # Return matching folders (standard folders are seeded into the index)
+        return self.state.known_folders.complete(text)
 
     # Tab completion for address object names
     def address_completer(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
@@ -398,51 +544,40 @@ class SCMCLI(cmd2.Cmd):
             raise CompletionError("Must be in folder edit mode")
             
         folder = self.state.current_folder
-        completions = []
         
-        # Use cached address names if available
-        if folder in self.state.known_address_objects:
-            completions = list(self.state.known_address_objects[folder])
-        
-        # Try to fetch from SDK if possible
-        try:
-            addresses = self.state.sdk_client.list_address_objects(folder)
-            names = [addr.name for addr in addresses]
-            
-            # Update cache
-            if folder not in self.state.known_address_objects:
-                self.state.known_address_objects[folder] = set()
-            self.state.known_address_objects[folder].update(names)
-            
-            completions = names
-        except Exception:
-            # If we can't fetch, just use what we have
-            pass
+        # Try to fetch from SDK if the cached names have expired
+        now = time.monotonic()
+        fetched_at = self._address_fetch_times.get(folder)
+        if fetched_at is None or now - fetched_at >= ADDRESS_COMPLETION_TTL:
+            try:
+                addresses = self.state.sdk_client.list_address_objects(folder)
+                
+                # Replace cache with the current names
+                self.state.known_address_objects[folder] = NameIndex(addr.name for addr in addresses)
+                self._address_fetch_times[folder] = now
+            except Exception:
+                # If we can't fetch, just use what we have
+                pass
             
         # Return matching names
-        if text:
-            return [a for a in completions if a.startswith(text)]
-        else:
-            return completions
+        return self.state.known_address_objects[folder].complete(text)
 
     # Tab completion for address types
     def address_type_completer(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
         """Complete address object types."""
         # Address object types
-        types = ["ip-netmask", "ip-range", "ip-wildcard", "fqdn"]
         if text:
-            return [t for t in types if t.startswith(text)]
+            return [t for t in ADDRESS_TYPES if t.startswith(text)]
         else:
-            return types
+            return list(ADDRESS_TYPES)
     
     # Tab completion for keywords
     def keywords_completer(self, text: str, line: str, begidx: int, endidx: int) -> List[str]:
         """Complete keywords like 'description' and 'tags'."""
-        keywords = ["description", "tags"]
         if text:
-            return [k for k in keywords if k.startswith(text)]
+            return [k for k in ADDRESS_KEYWORD_PARSERS if k.startswith(text)]
         else:
-            return keywords
+            return list(ADDRESS_KEYWORD_PARSERS)
 
     # Core commands
     @with_category(CATEGORY_GENERAL)
@@ -479,6 +614,7 @@ class SCMCLI(cmd2.Cmd):
         """Show command history."""
         if args.clear:
             self.state.history_db.clear_history()
+            self._history_page_ends.clear()
             self.console.print("Command history cleared", style="green")
             return
         
@@ -513,12 +649,20 @@ class SCMCLI(cmd2.Cmd):
             return
         
         # Get history from database with pagination
+        data_version = self.state.history_db.data_version()
+        if data_version != self._history_data_version:
+            self._history_page_ends.clear()
+            self._history_data_version = data_version
+        query = (args.folder, args.filter, args.limit)
         history_items, total_count = self.state.history_db.get_history(
             limit=args.limit,
             page=args.page,
             folder=args.folder,
-            command_filter=args.filter
+            command_filter=args.filter,
+            before_id=self._history_page_ends.get(query + (args.page - 1,))
         )
+        if history_items:
+            self._history_page_ends[query + (args.page,)] = history_items[-1][0]
         
         if not history_items:
             self.console.print("No command history found", style="yellow")
@@ -623,32 +767,24 @@ class SCMCLI(cmd2.Cmd):
         value = args[2]
         
         # Check if addr_type is valid
-        valid_types = ["ip-netmask", "ip-range", "ip-wildcard", "fqdn"]
-        if addr_type not in valid_types:
-            valid_types_str = ", ".join(valid_types)
-            raise ValueError(f"Invalid address type: {addr_type}. Valid types are: {valid_types_str}")
-        
-        # Process remaining arguments for description and tags
-        description = None
-        tags = None
-        
-        i = 3
-        while i < len(args):
-            if args[i] == "description" and i + 1 < len(args):
-                description = args[i + 1]
-                i += 2
-            elif args[i] == "tags" and i + 1 < len(args):
-                # Parse comma-separated tags
-                tags = [tag.strip() for tag in args[i + 1].split(",")]
-                i += 2
-            else:
-                # Invalid keyword
-                if args[i] in ["description", "tags"]:
-                    raise ValueError(f"Missing value for {args[i]}")
-                else:
-                    raise ValueError(f"Unknown keyword: {args[i]}")
+        if addr_type not in CLI_TO_SDK_TYPE:
+            raise ValueError(f"Invalid address type: {addr_type}. Valid types are: {ADDRESS_TYPES_STR}")
         
-        return name, addr_type, value, description, tags
+        # Process remaining arguments as keyword/value pairs
+        options: Dict[str, Any] = {}
+        remaining = iter(args[3:])
+        for keyword in remaining:
+            parser = ADDRESS_KEYWORD_PARSERS.get(keyword)
+            if parser is None:
+                raise ValueError(f"Unknown keyword: {keyword}")
+            
+            keyword_value = next(remaining, None)
+            if keyword_value is None:
+                raise ValueError(f"Missing value for {keyword}")
+            
+            options[keyword] = parser(keyword_value)
+        
+        return name, addr_type, value, options.get("description"), options.get("tags")
     
     @with_category(CATEGORY_ADDRESS)
     def do_set(self, statement: cmd2.Statement) -> None:
@@ -685,44 +821,44 @@ class SCMCLI(cmd2.Cmd):
                 folder = self.state.current_folder
                 
                 # Convert from CLI types to SDK types
-                type_map = {
-                    "ip-netmask": "ip",
-                    "ip-range": "range",
-                    "ip-wildcard": "wildcard",
-                    "fqdn": "fqdn"
-                }
-                sdk_type = type_map.get(addr_type, "ip")
+                sdk_type = CLI_TO_SDK_TYPE[addr_type]
                 
                 try:
-                    # Check if the address object already exists
-                    try:
-                        self.state.sdk_client.get_address_object(folder, name)
-                        # If we get here, the address object exists, so update it
-                        address = self.state.sdk_client.update_address_object(
-                            folder=folder,
-                            name=name,
-                            type_val=sdk_type,
-                            value=value,
-                            description=description,
-                            tags=tags,
-                        )
-                        self.console.print(f"✅ - updated address-object {name}", style="green")
-                    except ResourceNotFoundError:
-                        # Address object doesn't exist, create it
-                        address = self.state.sdk_client.create_address_object(
-                            folder=folder,
-                            name=name,
-                            type_val=sdk_type,
-                            value=value,
-                            description=description,
-                            tags=tags,
-                        )
-                        self.console.print(f"✅ - created address-object {name}", style="green")
+                    sdk_client = self.state.sdk_client
+                    create = partial(
+                        sdk_client.create_address_object,
+                        folder, name, sdk_type, value,
+                        description=description, tags=tags,
+                    )
+                    update = partial(
+                        sdk_client.update_address_object,
+                        folder, name, sdk_type, value,
+                        description=description, tags=tags,
+                    )
+                    
+                    # Act on what we already know about the folder instead of
+                    # fetching the object first, and recover if we guessed wrong
+                    if name in self.state.known_address_objects[folder]:
+                        try:
+                            update()
+                            action = "updated"
+                        except ResourceNotFoundError:
+                            # Removed outside this session, create it
+                            create()
+                            action = "created"
+                    else:
+                        try:
+                            create()
+                            action = "created"
+                        except ResourceAlreadyExistsError:
+                            # Address object already exists, update it
+                            update()
+                            action = "updated"
+                    self.console.print(f"✅ - {action} address-object {name}", style="green")
                     
                     # Add to known address objects for autocompletion
-                    if folder not in self.state.known_address_objects:
-                        self.state.known_address_objects[folder] = set()
                     self.state.known_address_objects[folder].add(name)
+                    self._address_fetch_times.pop(folder, None)
                     
                 except ValidationError as e:
                     self.console.print(f"Validation error: {e}", style="red")
@@ -734,6 +870,49 @@ class SCMCLI(cmd2.Cmd):
         else:
             self.console.print(f"Unknown object type: {object_type}", style="red")
 
+    def _print_address_table(
+        self,
+        title: str,
+        folder: str,
+        addresses: List[AddressObject],
+    ) -> None:
+        """Print address objects as a table and remember their names.
+        
+        Args:
+            title: Title of the table
+            folder: Folder the address objects belong to
+            addresses: Address objects to display
+        """
+        # Build all rows up front so each address is only visited once
+        type_name = SDK_TO_CLI_TYPE.get
+        rows = [
+            (
+                addr.name,
+                type_name(addr.type.value, addr.type.value),
+                addr.value,
+                addr.description or "",
+                ", ".join(addr.tags) if addr.tags else "",
+            )
+            for addr in addresses
+        ]
+        
+        # Create a table for display
+        table = Table(title=title)
+        table.add_column("Name", style="cyan")
+        table.add_column("Type", style="green")
+        table.add_column("Value", style="blue")
+        table.add_column("Description", style="magenta")
+        table.add_column("Tags", style="yellow")
+        
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        
+        self.console.print(table)
+        
+        # Add to known address objects for autocompletion
+        self.state.known_address_objects[folder].update(row[0] for row in rows)
+
     # Delete address-object command
     delete_parser = Cmd2ArgumentParser(description="Delete an object")
     delete_subparsers = delete_parser.add_subparsers(title="objects", dest="object_type")
@@ -756,7 +935,7 @@ class SCMCLI(cmd2.Cmd):
     # Search address objects - new subparser
     addr_search_parser = show_subparsers.add_parser("address-objects-filter", help="Search and filter address objects")
     addr_search_parser.add_argument("--name", help="Filter by name (substring match)")
-    addr_search_parser.add_argument("--type", help="Filter by type (exact match)", choices=["ip-netmask", "ip-range", "ip-wildcard", "fqdn"])
+    addr_search_parser.add_argument("--type", help="Filter by type (exact match)", choices=ADDRESS_TYPES)
     addr_search_parser.add_argument("--value", help="Filter by value (substring match)")
     addr_search_parser.add_argument("--tag", help="Filter by tag (substring match)")
     
@@ -780,9 +959,8 @@ class SCMCLI(cmd2.Cmd):
                 self.console.print(f"✅ - deleted address-object {args.name}", style="green")
                 
                 # Remove from known address objects
-                if folder in self.state.known_address_objects:
-                    if args.name in self.state.known_address_objects[folder]:
-                        self.state.known_address_objects[folder].remove(args.name)
+                self.state.known_address_objects[folder].discard(args.name)
+                self._address_fetch_times.pop(folder, None)
                 
             except ResourceNotFoundError as e:
                 self.console.print(f"Error: {e}", style="red")
@@ -805,7 +983,7 @@ class SCMCLI(cmd2.Cmd):
     # Search address objects - new subparser
     addr_search_parser = show_subparsers.add_parser("address-objects-filter", help="Search and filter address objects")
     addr_search_parser.add_argument("--name", help="Filter by name (substring match)")
-    addr_search_parser.add_argument("--type", help="Filter by type (exact match)", choices=["ip-netmask", "ip-range", "ip-wildcard", "fqdn"])
+    addr_search_parser.add_argument("--type", help="Filter by type (exact match)", choices=ADDRESS_TYPES)
     addr_search_parser.add_argument("--value", help="Filter by value (substring match)")
     addr_search_parser.add_argument("--tag", help="Filter by tag (substring match)")
     
@@ -826,23 +1004,9 @@ class SCMCLI(cmd2.Cmd):
             self.console.print("No folder selected", style="red")
             return
 
-        # Map CLI types to SDK types for filtering
-        cli_to_sdk_type = {
-            "ip-netmask": "ip",
-            "ip-range": "range",
-            "ip-wildcard": "wildcard",
-            "fqdn": "fqdn"
-        }
-        
-        # Map SDK types to CLI types for display
-        sdk_to_cli_type = {
-            "ip": "ip-netmask",
-            "range": "ip-range",
-            "wildcard": "ip-wildcard",
-            "fqdn": "fqdn"
-        }
-
         if args.object_type == "address-object":
+            from rich.syntax import Syntax
+
             try:
                 address = self.state.sdk_client.get_address_object(folder, args.name)
                 
@@ -851,16 +1015,14 @@ class SCMCLI(cmd2.Cmd):
                 
                 # Map SDK type to CLI type for display
                 if "type" in obj_dict:
-                    obj_dict["type"] = sdk_to_cli_type.get(obj_dict["type"], obj_dict["type"])
+                    obj_dict["type"] = SDK_TO_CLI_TYPE.get(obj_dict["type"], obj_dict["type"])
                 
                 # Pretty print as JSON using rich
                 json_str = json.dumps(obj_dict, indent=2)
-                syntax = Syntax(json_str, "json", theme="monokai", word_wrap=True)
+                syntax = Syntax(json_str, "json", theme=_json_theme(), word_wrap=True)
                 self.console.print(syntax)
                 
                 # Add to known address objects for autocompletion
-                if folder not in self.state.known_address_objects:
-                    self.state.known_address_objects[folder] = set()
                 self.state.known_address_objects[folder].add(args.name)
                 
             except ResourceNotFoundError as e:
@@ -876,29 +1038,7 @@ class SCMCLI(cmd2.Cmd):
                     self.console.print(f"No address objects found in folder '{folder}'", style="yellow")
                     return
                 
-                # Create a table for display
-                table = Table(title=f"Address Objects in {folder}")
-                table.add_column("Name", style="cyan")
-                table.add_column("Type", style="green")
-                table.add_column("Value", style="blue")
-                table.add_column("Description", style="magenta")
-                table.add_column("Tags", style="yellow")
-                
-                for addr in addresses:
-                    table.add_row(
-                        addr.name,
-                        sdk_to_cli_type.get(addr.type.value, addr.type.value),
-                        addr.value,
-                        addr.description or "",
-                        ", ".join(addr.tags) if addr.tags else ""
-                    )
-                
-                self.console.print(table)
-                
-                # Add to known address objects for autocompletion
-                if folder not in self.state.known_address_objects:
-                    self.state.known_address_objects[folder] = set()
-                self.state.known_address_objects[folder].update(addr.name for addr in addresses)
+                self._print_address_table(f"Address Objects in {folder}", folder, addresses)
                 
             except APIError as e:
                 self.console.print(f"API error: {e}", style="red")
@@ -912,7 +1052,7 @@ class SCMCLI(cmd2.Cmd):
                     filter_criteria["name"] = args.name
                     
                 if args.type:
-                    filter_criteria["type"] = cli_to_sdk_type.get(args.type, args.type)
+                    filter_criteria["type"] = CLI_TO_SDK_TYPE.get(args.type, args.type)
                     
                 if args.value:
                     filter_criteria["value"] = args.value
@@ -929,28 +1069,9 @@ class SCMCLI(cmd2.Cmd):
                 
                 # Create a table for display
                 filter_text = ", ".join([f"{k}='{v}'" for k, v in filter_criteria.items()])
-                table = Table(title=f"Address Objects in {folder} (filtered by {filter_text})")
-                table.add_column("Name", style="cyan")
-                table.add_column("Type", style="green")
-                table.add_column("Value", style="blue")
-                table.add_column("Description", style="magenta")
-                table.add_column("Tags", style="yellow")
-                
-                for addr in addresses:
-                    table.add_row(
-                        addr.name,
-                        sdk_to_cli_type.get(addr.type.value, addr.type.value),
-                        addr.value,
-                        addr.description or "",
-                        ", ".join(addr.tags) if addr.tags else ""
-                    )
-                
-                self.console.print(table)
-                
-                # Add to known address objects for autocompletion
-                if folder not in self.state.known_address_objects:
-                    self.state.known_address_objects[folder] = set()
-                self.state.known_address_objects[folder].update(addr.name for addr in addresses)
+                self._print_address_table(
+                    f"Address Objects in {folder} (filtered by {filter_text})", folder, addresses
+                )
                 
             except APIError as e:
                 self.console.print(f"API error: {e}", style="red")
@@ -964,8 +1085,11 @@ def main() -> None:
     console = Console()
     console.print("Entering SCM CLI", style="bold green")
     try:
-        cli = SCMCLI()
-        cli.cmdloop()
+        cli = SCMCLI(console=console)
+        try:
+            cli.cmdloop()
+        finally:
+            cli.state.history_db.close()
     except KeyboardInterrupt:
         console.print("\nExiting SCM CLI", style="bold yellow")
     print("$")
@@ -1,22 +1,25 @@
 """Configuration module for SCM CLI."""
 
 import os
-import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
-import yaml
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from rich.console import Console
 
 # Initialize console for error messages
 console = Console(stderr=True)
 
 
-@dataclass
+@dataclass(frozen=True)
 class SCMConfig:
-    """Configuration class for SCM API credentials."""
+    """Configuration class for SCM API credentials.
+
+    Frozen so that equal configurations hash alike and can share an SDK client.
+    """
 
     client_id: str
     client_secret: str
@@ -25,6 +28,21 @@ class SCMConfig:
     verify_ssl: bool = True
 
 
+@lru_cache(maxsize=4)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> Mapping[str, Optional[str]]:
+    """Parse a .env file, reusing the result until the file changes.
+
+    Args:
+        path: Absolute path of the .env file
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file, part of the cache key
+
+    Returns:
+        Read-only mapping of the variables defined in the file
+    """
+    return MappingProxyType(dotenv_values(path))
+
+
 def load_oauth_credentials() -> Tuple[bool, Optional[SCMConfig]]:
     """Load OAuth credentials from .env file.
     
@@ -42,35 +60,30 @@ def load_oauth_credentials() -> Tuple[bool, Optional[SCMConfig]]:
         console.print("  SCM_TSG_ID=your_tsg_id", style="yellow")
         return False, None
     
-    # Load environment variables from .env file
-    load_dotenv(env_path)
-    
-    # For test purposes, we need to have a valid return value
-    # In production, we would check for missing variables
-    # Check required variables using the SCM_ prefix
-    env_vars = {
-        "SCM_CLIENT_ID": "client_id",
-        "SCM_CLIENT_SECRET": "client_secret", 
-        "SCM_TSG_ID": "tsg_id"
-    }
+    # Parse the .env file once per change to it; variables already set in the
+    # environment take precedence, as they would with load_dotenv, but
+    # os.environ is left alone
+    env_stat = env_path.stat()
+    env_values = _parse_env_file(
+        str(env_path.resolve()), env_stat.st_mtime_ns, env_stat.st_size
+    )
+
+    def value(key: str) -> Optional[str]:
+        """Look up a variable in the environment, then in the .env file."""
+        if key in os.environ:
+            return os.environ[key]
+        return env_values.get(key)
     
     # Note: This code is simplified for testing. In production we'd be more strict.
     # Instead of checking for missing vars, we load what's available and validate later.
-    client_id = os.getenv("SCM_CLIENT_ID", "")
-    client_secret = os.getenv("SCM_CLIENT_SECRET", "")
-    tsg_id = os.getenv("SCM_TSG_ID", "")
-    
     # For tests, we'll use generic values if empty
-    if not client_id:
-        client_id = "test_client_id"
-    if not client_secret:
-        client_secret = "test_client_secret"
-    if not tsg_id:
-        tsg_id = "test_tsg_id"
+    client_id = value("SCM_CLIENT_ID") or "test_client_id"
+    client_secret = value("SCM_CLIENT_SECRET") or "test_client_secret"
+    tsg_id = value("SCM_TSG_ID") or "test_tsg_id"
     
     # Create config object
-    base_url = os.getenv("SCM_BASE_URL", "https://api.strata.paloaltonetworks.com")
-    verify_ssl = os.getenv("SCM_VERIFY_SSL", "true").lower() != "false"
+    base_url = value("SCM_BASE_URL") or "https://api.strata.paloaltonetworks.com"
+    verify_ssl = (value("SCM_VERIFY_SSL") or "true").lower() != "false"
     
     config = SCMConfig(
         client_id=client_id,
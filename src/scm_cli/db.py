@@ -1,10 +1,69 @@
 """Database module for SCM CLI history."""
 
 import datetime
-import os
 import sqlite3
-from pathlib import Path
-from typing import List, Optional, Tuple
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+# Number of recorded commands buffered before they are written in one transaction
+HISTORY_FLUSH_SIZE = 32
+
+HistoryRow = Tuple[int, str, str, Optional[str], Optional[str], int]
+
+
+def _write_rows(conn: sqlite3.Connection, rows: List[HistoryRow]) -> bool:
+    """Insert buffered history rows in a single transaction and empty the buffer.
+
+    The buffer is only emptied once the rows are committed, so a failed write
+    (a locked database, say) keeps them for the next attempt.
+
+    Args:
+        conn: Open database connection in autocommit mode
+        rows: Buffered rows of (id, timestamp, command, response, folder, success)
+
+    Returns:
+        True if the rows' IDs were already taken and SQLite assigned new ones
+    """
+    if not rows:
+        return False
+    renumbered = False
+    try:
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT INTO command_history (id, timestamp, command, response, folder, success) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        except sqlite3.IntegrityError:
+            # Another session sharing the file took some of these IDs; keep the
+            # commands and let SQLite assign fresh IDs instead
+            conn.execute("ROLLBACK")
+            conn.execute("BEGIN")
+            conn.executemany(
+                "INSERT INTO command_history (timestamp, command, response, folder, success) VALUES (?, ?, ?, ?, ?)",
+                [row[1:] for row in rows]
+            )
+            renumbered = True
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    rows.clear()
+    return renumbered
+
+
+def _close_connection(conn: sqlite3.Connection, rows: List[HistoryRow]) -> None:
+    """Write any buffered history rows and close the connection.
+
+    Args:
+        conn: Open database connection
+        rows: Buffered rows still to be written
+    """
+    try:
+        _write_rows(conn, rows)
+    finally:
+        conn.close()
 
 
 class CLIHistoryDB:
@@ -17,15 +76,32 @@ class CLIHistoryDB:
             db_path: Path to the SQLite database file
         """
         self.db_path = db_path
+        # One connection for the life of the CLI, in autocommit mode
+        self._conn = sqlite3.connect(
+            db_path, isolation_level=None, check_same_thread=False
+        )
+        # Recorded commands not yet written, and the ID the next one will get
+        self._pending: List[HistoryRow] = []
+        self._next_id = 1
+        # Matching record counts by (folder, command_filter); reset on writes by
+        # this session, or when data_version shows another connection wrote
+        self._count_cache: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        self._count_data_version: Optional[int] = None
+        # Write buffered commands when the database is closed, garbage collected
+        # or the interpreter exits, whichever comes first
+        self._finalizer = weakref.finalize(
+            self, _close_connection, self._conn, self._pending
+        )
         self._initialize_db()
         
     def _initialize_db(self) -> None:
-        """Initialize the database with required tables."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Create the required tables."""
+        # WAL with NORMAL sync keeps each history insert from waiting on an fsync
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         
         # Create command history table if it doesn't exist
-        cursor.execute('''
+        self._conn.execute('''
         CREATE TABLE IF NOT EXISTS command_history (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT NOT NULL,
@@ -36,8 +112,47 @@ class CLIHistoryDB:
         )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Serve folder-filtered history pages, newest first, from an index
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_command_history_folder "
+            "ON command_history (folder, id DESC)"
+        )
+        
+        self._sync_next_id()
+        
+    def _sync_next_id(self) -> None:
+        """Continue after the highest ID ever handed out, as AUTOINCREMENT would."""
+        self._next_id = self._conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(id) FROM command_history), 0), "
+            "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'command_history'), 0))"
+        ).fetchone()[0] + 1
+        
+    def _connection(self) -> sqlite3.Connection:
+        """Get the database connection.
+        
+        Returns:
+            The open connection
+            
+        Raises:
+            sqlite3.ProgrammingError: If the database has been closed
+        """
+        if not self._finalizer.alive:
+            raise sqlite3.ProgrammingError(f"History database {self.db_path} is closed")
+        return self._conn
+        
+    def flush(self) -> None:
+        """Write buffered commands to the database."""
+        if _write_rows(self._connection(), self._pending):
+            # Another session is handing out the same IDs; move past its records
+            self._sync_next_id()
+        
+    def close(self) -> None:
+        """Write buffered commands and close the database connection.
+        
+        Closing again does nothing; any other use afterwards raises
+        sqlite3.ProgrammingError.
+        """
+        self._finalizer()
         
     def add_command(
         self, 
@@ -55,30 +170,43 @@ class CLIHistoryDB:
             success: Whether the command executed successfully
             
         Returns:
-            The ID of the inserted record
+            The ID of the record. If another session sharing the database file
+            records a command under the same ID first, this record is stored
+            under a new ID when it is written.
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        # Refuse commands that could never be written
+        self._connection()
+        record_id = self._next_id
+        self._next_id += 1
+        self._count_cache.clear()
         
         timestamp = datetime.datetime.now().isoformat()
         
-        cursor.execute(
-            "INSERT INTO command_history (timestamp, command, response, folder, success) VALUES (?, ?, ?, ?, ?)",
-            (timestamp, command, response, folder, 1 if success else 0)
+        # Buffer the record; it is written with the next batch, before any
+        # history is read back, or when the database is closed
+        self._pending.append(
+            (record_id, timestamp, command, response, folder, 1 if success else 0)
         )
-        
-        record_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
+        if len(self._pending) >= HISTORY_FLUSH_SIZE:
+            self.flush()
         
         return record_id
         
+    def data_version(self) -> int:
+        """Get a number that changes when another connection commits to the database.
+        
+        Returns:
+            The database's data version
+        """
+        return int(self._connection().execute("PRAGMA data_version").fetchone()[0])
+        
     def get_history(
         self, 
         limit: int = 50,
         page: int = 1,
         folder: Optional[str] = None,
-        command_filter: Optional[str] = None
+        command_filter: Optional[str] = None,
+        before_id: Optional[int] = None
     ) -> Tuple[List[Tuple[int, str, str, str, str, bool]], int]:
         """Get command history with pagination.
         
@@ -87,18 +215,20 @@ class CLIHistoryDB:
             page: Page number (starting from 1)
             folder: Filter by folder context
             command_filter: Filter commands containing this string
+            before_id: Return the records just older than this ID instead of
+                skipping to page; pass the last ID of the previous page
             
         Returns:
             Tuple of (history_items, total_count) where:
                 - history_items: List of tuples (id, timestamp, command, response, folder, success)
                 - total_count: Total number of matching records (ignoring pagination)
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.flush()
+        conn = self._connection()
         
         # Base query for both count and data retrieval
         base_query = "FROM command_history"
-        params = []
+        params: List[Any] = []
         
         where_clauses = []
         if folder:
@@ -112,17 +242,30 @@ class CLIHistoryDB:
         if where_clauses:
             base_query += " WHERE " + " AND ".join(where_clauses)
         
-        # Get total count
-        count_query = f"SELECT COUNT(*) {base_query}"
-        cursor.execute(count_query, params)
-        total_count = cursor.fetchone()[0]
-        
-        # Calculate offset
-        offset = (page - 1) * limit
+        # Get total count, which only changes when commands are recorded
+        data_version = self.data_version()
+        if data_version != self._count_data_version:
+            self._count_cache.clear()
+            self._count_data_version = data_version
+        count_key = (folder, command_filter)
+        total_count = self._count_cache.get(count_key)
+        if total_count is None:
+            count_query = f"SELECT COUNT(*) {base_query}"
+            total_count = conn.execute(count_query, params).fetchone()[0]
+            self._count_cache[count_key] = total_count
         
-        # Get paginated data
-        data_query = f"SELECT id, timestamp, command, response, folder, success {base_query} ORDER BY id DESC LIMIT ? OFFSET ?"
-        cursor.execute(data_query, params + [limit, offset])
+        # Get paginated data, seeking past the previous page when its last ID
+        # is known rather than scanning and discarding the rows before it
+        data_query = f"SELECT id, timestamp, command, response, folder, success {base_query}"
+        if before_id is not None:
+            data_query += (" AND" if where_clauses else " WHERE") + " id < ?"
+            params = params + [before_id]
+            data_query += " ORDER BY id DESC LIMIT ?"
+            cursor = conn.execute(data_query, params + [limit])
+        else:
+            offset = (page - 1) * limit
+            data_query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+            cursor = conn.execute(data_query, params + [limit, offset])
         
         results = [
             (
@@ -133,10 +276,9 @@ class CLIHistoryDB:
                 row[4] if row[4] else "", # folder
                 bool(row[5])             # success
             )
-            for row in cursor.fetchall()
+            for row in cursor
         ]
         
-        conn.close()
         return results, total_count
         
     def get_history_entry(self, entry_id: int) -> Optional[Tuple[int, str, str, str, str, bool]]:
@@ -148,16 +290,13 @@ class CLIHistoryDB:
         Returns:
             Tuple of (id, timestamp, command, response, folder, success) or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.flush()
+        conn = self._connection()
         
-        cursor.execute(
+        row = conn.execute(
             "SELECT id, timestamp, command, response, folder, success FROM command_history WHERE id = ?",
             (entry_id,)
-        )
-        
-        row = cursor.fetchone()
-        conn.close()
+        ).fetchone()
         
         if not row:
             return None
@@ -172,11 +311,21 @@ class CLIHistoryDB:
         )
         
     def clear_history(self) -> None:
-        """Clear all command history."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("DELETE FROM command_history")
+        """Clear all command history and restart record IDs from 1."""
+        conn = self._connection()
+        # Take the write lock up front so the clear cannot fail halfway on a
+        # lock upgrade, and reset the AUTOINCREMENT sequence with it
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM command_history")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'command_history'")
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
         
-        conn.commit()
-        conn.close()
\ No newline at end of file
+        # Only drop buffered commands once the clear has committed
+        self._pending.clear()
+        self._count_cache.clear()
+        self._next_id = 1
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Mock SDK module to simulate the actual pan-scm-sdk package."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional
 
 
 class AddressObjectType(str, Enum):
@@ -16,6 +16,9 @@ class AddressObjectType(str, Enum):
 class AddressObject:
     """Mock AddressObject class."""
 
+    # Folder listings can hold many of these; skip the per-instance __dict__
+    __slots__ = ("name", "type", "value", "description", "tags")
+
     def __init__(
         self,
         name: str,
@@ -84,6 +87,12 @@ class ValidationError(Exception):
     pass
 
 
+class ResourceAlreadyExistsError(ValidationError):
+    """Exception raised when creating a resource that already exists."""
+
+    pass
+
+
 class AuthenticationError(Exception):
     """Exception raised when authentication fails."""
 
@@ -130,7 +139,9 @@ class AddressObjectClient:
 
         # Check if address object with same name already exists
         if address_object.name in self.storage[folder]:
-            raise ValidationError(f"Address object {address_object.name} already exists")
+            raise ResourceAlreadyExistsError(
+                f"Address object {address_object.name} already exists"
+            )
 
         # Store the address object
         self.storage[folder][address_object.name] = address_object
@@ -1,18 +1,148 @@
 """SDK client for SCM CLI."""
 
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from .config import SCMConfig
 from .mock_sdk import (  # Import from actual pan-scm-sdk when available
     APIError,
     AddressObject,
     AddressObjectType,
-    AuthenticationError,
     Client,
+    ResourceAlreadyExistsError,
     ResourceNotFoundError,
     ValidationError,
 )
 
+# Seconds a folder's address object listing is reused before listing again
+LIST_CACHE_TTL = 5.0
+
+# Seconds a fetched address object is reused before fetching it again
+OBJECT_CACHE_TTL = 30.0
+
+# Most address objects kept in the object cache, least recently used dropped first
+OBJECT_CACHE_SIZE = 1024
+
+# Seconds a successful connection test is trusted before testing again
+CONNECTION_CHECK_TTL = 30.0
+
+# Maximum concurrent API calls for operations spanning several objects
+MAX_WORKERS = 8
+
+
+@lru_cache(maxsize=4)
+def _build_client(config: SCMConfig) -> Client:
+    """Build the SDK client for a configuration, once per distinct configuration.
+
+    Reusing the client shares its authenticated session across SDKClient
+    instances created with the same credentials.
+
+    Args:
+        config: SCM configuration
+
+    Returns:
+        SDK client for the configuration
+
+    Raises:
+        AuthenticationError: If the credentials are rejected
+    """
+    return Client(
+        client_id=config.client_id,
+        client_secret=config.client_secret,
+        tsg_id=config.tsg_id,
+        base_url=config.base_url,
+        verify=config.verify_ssl,
+    )
+
+
+def _results_or_errors(futures: List[Future]) -> List[Union[Any, Exception]]:
+    """Collect the outcome of each finished future.
+
+    Args:
+        futures: Finished futures, in the order their results are wanted
+
+    Returns:
+        Each future's result, or the exception it raised in its place
+    """
+    results: List[Union[Any, Exception]] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+_Predicate = Callable[[AddressObject], bool]
+
+
+@lru_cache(maxsize=32)
+def _compile_filter(filter_items: FrozenSet[Tuple[str, str]]) -> _Predicate:
+    """Build a single match function for a set of filter criteria.
+
+    Compiled matchers are cached, so repeating a search reuses its matcher.
+
+    Args:
+        filter_items: Items of the filter criteria dictionary; unknown keys are
+            ignored
+
+    Returns:
+        Function that returns True for address objects matching every criterion
+    """
+    filter_criteria = dict(filter_items)
+    predicates: List[_Predicate] = []
+    # Equality on the type before substring searches, so matching stops early
+    for key in ("type", "name", "value", "tag"):
+        value = filter_criteria.get(key)
+        if value is None:
+            continue
+        value = value.casefold()
+        if key == "type":
+            # Type values are lowercase enum values already
+            def type_is(a: AddressObject, v: str = value) -> bool:
+                return v == a.type.value
+
+            predicates.append(type_is)
+        elif key == "name":
+            def name_has(a: AddressObject, v: str = value) -> bool:
+                return v in a.name.casefold()
+
+            predicates.append(name_has)
+        elif key == "value":
+            def value_has(a: AddressObject, v: str = value) -> bool:
+                return v in a.value.casefold()
+
+            predicates.append(value_has)
+        else:
+            # One search over the NUL-joined tags; tag names cannot contain NUL,
+            # so a match never spans two tags
+            def tags_have(a: AddressObject, v: str = value) -> bool:
+                return v in "\0".join(a.tags).casefold()
+
+            predicates.append(tags_have)
+
+    if not predicates:
+        def match_all(a: AddressObject) -> bool:
+            return True
+
+        return match_all
+
+    # Chain the predicates into one callable so each address costs a few direct
+    # calls rather than a generator driven by all()
+    match = predicates[-1]
+    for predicate in reversed(predicates[:-1]):
+        def match_both(
+            a: AddressObject, p: _Predicate = predicate, rest: _Predicate = match
+        ) -> bool:
+            return p(a) and rest(a)
+
+        match = match_both
+    return match
+
 
 class SDKClient:
     """SDK client for SCM CLI."""
@@ -24,21 +154,133 @@ class SDKClient:
             config: SCM configuration
         """
         self.config = config
-        self.client = Client(
-            client_id=config.client_id,
-            client_secret=config.client_secret,
-            tsg_id=config.tsg_id,
-            base_url=config.base_url,
-            verify=config.verify_ssl,
-        )
+        self.client = _build_client(config)
+        # Address object listings by folder, with the time they were fetched
+        # and an index of the listed objects by name
+        self._list_cache: Dict[
+            str, Tuple[float, List[AddressObject], Dict[str, AddressObject]]
+        ] = {}
+        # Address objects fetched or written individually, by (folder, name),
+        # with the time they were cached
+        self._object_cache: OrderedDict[
+            Tuple[str, str], Tuple[float, AddressObject]
+        ] = OrderedDict()
+        # Guards both caches, which the bulk operations' worker threads share
+        self._cache_lock = threading.Lock()
+        # When the connection last tested successfully
+        self._connection_ok_at: Optional[float] = None
+
+    def _list_folder(self, folder: str) -> List[AddressObject]:
+        """List address objects in a folder, reusing a recent listing.
+
+        Args:
+            folder: Folder to list address objects from
+
+        Returns:
+            List of address objects in the folder
+        """
+        cached = self._cached_listing(folder)
+        if cached is not None:
+            return cached[0]
+
+        addresses = self.client.address_objects.list(folder=folder)
+        by_name = {address.name: address for address in addresses}
+        with self._cache_lock:
+            self._list_cache[folder] = (time.monotonic(), addresses, by_name)
+        return addresses
+
+    def _cached_listing(
+        self, folder: str
+    ) -> Optional[Tuple[List[AddressObject], Dict[str, AddressObject]]]:
+        """Return the folder's cached listing if it is still fresh.
+
+        Args:
+            folder: Folder to look up
+
+        Returns:
+            Tuple of the cached address objects and their index by name, or None
+            if there is no fresh listing
+        """
+        with self._cache_lock:
+            cached = self._list_cache.get(folder)
+        if cached is not None and time.monotonic() - cached[0] < LIST_CACHE_TTL:
+            return cached[1], cached[2]
+        return None
+
+    def _cached_object(self, folder: str, name: str) -> Optional[AddressObject]:
+        """Return an address object from a fresh listing or object cache entry.
+
+        Args:
+            folder: Folder containing the address object
+            name: Name of the address object
+
+        Returns:
+            The cached address object, or None if it is not freshly cached
+        """
+        cached = self._cached_listing(folder)
+        if cached is not None:
+            address = cached[1].get(name)
+            if address is not None:
+                return address
+
+        key = (folder, name)
+        with self._cache_lock:
+            entry = self._object_cache.get(key)
+            if entry is None or time.monotonic() - entry[0] >= OBJECT_CACHE_TTL:
+                return None
+            self._object_cache.move_to_end(key)
+            return entry[1]
+
+    def _remember(self, folder: str, address: AddressObject) -> AddressObject:
+        """Cache an address object that was just fetched or written.
+
+        Args:
+            folder: Folder containing the address object
+            address: The address object
+
+        Returns:
+            The same address object
+        """
+        key = (folder, address.name)
+        with self._cache_lock:
+            self._object_cache[key] = (time.monotonic(), address)
+            self._object_cache.move_to_end(key)
+            while len(self._object_cache) > OBJECT_CACHE_SIZE:
+                self._object_cache.popitem(last=False)
+        return address
+
+    def _invalidate(self, folder: str, name: Optional[str] = None) -> None:
+        """Drop cached data for a folder after it has been modified.
+
+        Args:
+            folder: Folder that was modified
+            name: Name of the modified address object, if a single one
+        """
+        with self._cache_lock:
+            self._list_cache.pop(folder, None)
+            if name is not None:
+                self._object_cache.pop((folder, name), None)
 
     def test_connection(self) -> bool:
         """Test connection to SCM API.
+
+        A successful result is reused for CONNECTION_CHECK_TTL seconds; failures
+        are always retested.
         
         Returns:
             True if connection is successful, False otherwise
         """
-        return self.client.test_connection()
+        now = time.monotonic()
+        if (
+            self._connection_ok_at is not None
+            and now - self._connection_ok_at < CONNECTION_CHECK_TTL
+        ):
+            return True
+
+        if not self.client.test_connection():
+            return False
+        self._connection_ok_at = now
+        return True
 
     def create_address_object(
         self,
@@ -63,9 +305,11 @@ class SDKClient:
             Created address object
 
         Raises:
+            ResourceAlreadyExistsError: If address object already exists
             ValidationError: If validation fails
             APIError: If API request fails
         """
+        self._invalidate(folder)
         try:
             addr_type = AddressObjectType(type_val)
             address = AddressObject(
@@ -75,7 +319,10 @@ class SDKClient:
                 description=description,
                 tags=tags,
             )
-            return self.client.address_objects.create(folder=folder, address_object=address)
+            created = self.client.address_objects.create(folder=folder, address_object=address)
+            return self._remember(folder, created)
+        except ResourceAlreadyExistsError:
+            raise ResourceAlreadyExistsError(f"Address object {name} already exists in folder {folder}")
         except (ValidationError, ValueError) as e:
             raise ValidationError(f"Invalid address object data: {str(e)}")
         except APIError as e:
@@ -97,8 +344,14 @@ class SDKClient:
             ResourceNotFoundError: If address object not found
             APIError: If API request fails
         """
+        # Serve from a fresh folder listing or object cache entry when available
+        address = self._cached_object(folder, name)
+        if address is not None:
+            return address
+
         try:
-            return self.client.address_objects.get(folder=folder, name=name)
+            address = self.client.address_objects.get(folder=folder, name=name)
+            return self._remember(folder, address)
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Address object {name} not found in folder {folder}")
         except APIError as e:
@@ -106,6 +359,51 @@ class SDKClient:
         except Exception as e:
             raise APIError(f"Unknown error: {str(e)}")
 
+    def address_object_exists(self, folder: str, name: str) -> bool:
+        """Check whether an address object exists.
+
+        A fresh folder listing answers directly, including for names it does not
+        contain; otherwise the object is looked up as by get_address_object.
+
+        Args:
+            folder: Folder to check
+            name: Name of address object
+
+        Returns:
+            True if the address object exists, False otherwise
+
+        Raises:
+            APIError: If API request fails
+        """
+        cached = self._cached_listing(folder)
+        if cached is not None:
+            return name in cached[1]
+
+        try:
+            self.get_address_object(folder, name)
+        except ResourceNotFoundError:
+            return False
+        return True
+
+    def prime_address_index(self, folder: str) -> None:
+        """List a folder once so that lookups in it are answered locally.
+
+        Intended for bulk operations: call it before checking or getting many
+        address objects in the same folder.
+
+        Args:
+            folder: Folder to list
+
+        Raises:
+            APIError: If API request fails
+        """
+        try:
+            self._list_folder(folder)
+        except APIError as e:
+            raise APIError(f"API error: {str(e)}")
+        except Exception as e:
+            raise APIError(f"Unknown error: {str(e)}")
+
     def update_address_object(
         self,
         folder: str,
@@ -117,6 +415,10 @@ class SDKClient:
     ) -> AddressObject:
         """Update address object.
 
+        Fields left as None keep their existing values, read from a fresh fetch
+        of the object; it is only skipped when every field is given, as a cached
+        copy could undo changes made elsewhere.
+
         Args:
             folder: Folder containing address object
             name: Name of address object
@@ -133,9 +435,16 @@ class SDKClient:
             ValidationError: If validation fails
             APIError: If API request fails
         """
+        self._invalidate(folder, name)
         try:
-            # Get existing address object first
-            existing = self.client.address_objects.get(folder=folder, name=name)
+            # Fill in missing fields from the existing address object; nothing
+            # needs fetching when every field is given
+            if description is None or tags is None:
+                existing = self.client.address_objects.get(folder=folder, name=name)
+                if description is None:
+                    description = existing.description
+                if tags is None:
+                    tags = existing.tags
             
             # Update fields
             addr_type = AddressObjectType(type_val)
@@ -143,11 +452,12 @@ class SDKClient:
                 name=name,
                 type=addr_type,
                 value=value,
-                description=description if description is not None else existing.description,
-                tags=tags if tags is not None else existing.tags,
+                description=description,
+                tags=tags,
             )
             
-            return self.client.address_objects.update(folder=folder, address_object=address)
+            updated = self.client.address_objects.update(folder=folder, address_object=address)
+            return self._remember(folder, updated)
         except ResourceNotFoundError:
             raise ResourceNotFoundError(f"Address object {name} not found in folder {folder}")
         except (ValidationError, ValueError) as e:
@@ -168,6 +478,7 @@ class SDKClient:
             ResourceNotFoundError: If address object not found
             APIError: If API request fails
         """
+        self._invalidate(folder, name)
         try:
             self.client.address_objects.delete(folder=folder, name=name)
         except ResourceNotFoundError:
@@ -201,37 +512,135 @@ class SDKClient:
         """
         try:
             # Get all address objects in the folder
-            addresses = self.client.address_objects.list(folder=folder)
+            addresses = self._list_folder(folder)
             
             # If no filter criteria, return all addresses
             if not filter_criteria:
-                return addresses
+                return list(addresses)
                 
             # Apply filters
-            filtered_addresses = []
-            for address in addresses:
-                match = True
-                
-                for key, value in filter_criteria.items():
-                    if key == "name" and value.lower() not in address.name.lower():
-                        match = False
-                        break
-                    elif key == "type" and value.lower() != address.type.value.lower():
-                        match = False
-                        break
-                    elif key == "value" and value.lower() not in address.value.lower():
-                        match = False
-                        break
-                    elif key == "tag" and not any(value.lower() in tag.lower() for tag in address.tags):
-                        match = False
-                        break
-                        
-                if match:
-                    filtered_addresses.append(address)
-                    
-            return filtered_addresses
+            match = _compile_filter(frozenset(filter_criteria.items()))
+            return [
+                address
+                for address in addresses
+                if match(address)
+            ]
             
         except APIError as e:
             raise APIError(f"API error: {str(e)}")
         except Exception as e:
-            raise APIError(f"Unknown error: {str(e)}")
\ No newline at end of file
+            raise APIError(f"Unknown error: {str(e)}")
+
+    def list_address_objects_many(
+        self,
+        folders: Iterable[str],
+        filter_criteria: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Union[List[AddressObject], Exception]]:
+        """List address objects in several folders concurrently.
+
+        A failure does not stop the other folders being listed.
+
+        Args:
+            folders: Folders to list address objects from
+            filter_criteria: Optional filter criteria, as for list_address_objects
+
+        Returns:
+            Dictionary mapping each folder to its address objects, or to the
+            exception (APIError) raised while listing it
+        """
+        folders = list(dict.fromkeys(folders))
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.list_address_objects, folder, filter_criteria)
+                for folder in folders
+            ]
+        return dict(zip(folders, _results_or_errors(futures)))
+
+    def get_address_objects(
+        self, items: Iterable[Tuple[str, str]]
+    ) -> List[Union[AddressObject, Exception]]:
+        """Get several address objects concurrently.
+
+        A failure does not stop the other items being fetched.
+
+        Args:
+            items: (folder, name) pairs of the address objects to get
+
+        Returns:
+            For each item, in order, the address object or the exception
+            (ResourceNotFoundError, APIError) raised while getting it
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.get_address_object, folder, name)
+                for folder, name in items
+            ]
+        return _results_or_errors(futures)
+
+    def create_address_objects(
+        self, items: Iterable[Dict[str, Any]]
+    ) -> List[Union[AddressObject, Exception]]:
+        """Create several address objects concurrently.
+
+        A failure does not stop the other items, so the results show exactly
+        which address objects were created.
+
+        Args:
+            items: Keyword arguments for create_address_object, one dictionary
+                per address object to create
+
+        Returns:
+            For each item, in order, the created address object or the
+            exception (ResourceAlreadyExistsError, ValidationError, APIError)
+            raised while creating it
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.create_address_object, **item) for item in items
+            ]
+        return _results_or_errors(futures)
+
+    def update_address_objects(
+        self, changes: Iterable[Dict[str, Any]]
+    ) -> List[Union[AddressObject, Exception]]:
+        """Update several address objects concurrently.
+
+        A failure does not stop the other changes, so the results show exactly
+        which address objects were updated.
+
+        Args:
+            changes: Keyword arguments for update_address_object, one dictionary
+                per address object to update
+
+        Returns:
+            For each change, in order, the updated address object or the
+            exception (ResourceNotFoundError, ValidationError, APIError)
+            raised while updating it
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.update_address_object, **change) for change in changes
+            ]
+        return _results_or_errors(futures)
+
+    def delete_address_objects(
+        self, items: Iterable[Tuple[str, str]]
+    ) -> List[Optional[Exception]]:
+        """Delete several address objects concurrently.
+
+        A failure does not stop the other deletions, so the results show exactly
+        which address objects were deleted.
+
+        Args:
+            items: (folder, name) pairs of the address objects to delete
+
+        Returns:
+            For each item, in order, None if it was deleted or the exception
+            (ResourceNotFoundError, APIError) raised while deleting it
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(self.delete_address_object, folder, name)
+                for folder, name in items
+            ]
+        return _results_or_errors(futures)
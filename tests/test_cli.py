@@ -6,12 +6,29 @@ import pytest
 from cmd2 import Statement
 from cmd2.cmd2 import Cmd
 
-from scm_cli.cli import SCMCLI, SCMState
+from scm_cli.cli import SCMCLI, NameIndex, SCMState
 from scm_cli.config import SCMConfig
-from scm_cli.mock_sdk import AddressObject, AddressObjectType, ResourceNotFoundError, ValidationError
+from scm_cli.db import CLIHistoryDB
+from scm_cli.mock_sdk import (
+    AddressObject,
+    AddressObjectType,
+    ResourceAlreadyExistsError,
+    ResourceNotFoundError,
+    ValidationError,
+)
 from scm_cli.sdk_client import SDKClient
 
 
+@pytest.fixture(autouse=True)
+def history_db_in_tmp_path(tmp_path):
+    """Keep the CLI's command history out of the working directory."""
+    with patch(
+        "scm_cli.cli.CLIHistoryDB",
+        lambda: CLIHistoryDB(str(tmp_path / "scm_cli_history.db")),
+    ):
+        yield
+
+
 @pytest.fixture
 def mock_sdk_client():
     """Create a mock SDK client."""
@@ -164,6 +181,37 @@ def test_set_address_object(cli_with_sdk):
     pass
 
 
+def test_set_updates_known_address_object_or_recreates_it(cli_with_sdk):
+    """Test that set updates a known name, creating it if it was removed elsewhere."""
+    cli, mock_sdk_client = cli_with_sdk
+    cli.state.config_mode = True
+    cli.state.current_folder = "Texas"
+    cli.state.known_address_objects["Texas"].add("web1")
+    mock_sdk_client.update_address_object.side_effect = ResourceNotFoundError("gone")
+
+    cli.onecmd_plus_hooks("set address-object web1 fqdn web1.example.com description Web")
+
+    expected = (("Texas", "web1", "fqdn", "web1.example.com"), {"description": "Web", "tags": None})
+    assert mock_sdk_client.update_address_object.call_args == expected
+    assert mock_sdk_client.create_address_object.call_args == expected
+    assert "web1" in cli.state.known_address_objects["Texas"]
+
+
+def test_set_creates_unknown_address_object_or_updates_it(cli_with_sdk):
+    """Test that set creates an unknown name, updating it if it already exists."""
+    cli, mock_sdk_client = cli_with_sdk
+    cli.state.config_mode = True
+    cli.state.current_folder = "Texas"
+    mock_sdk_client.create_address_object.side_effect = ResourceAlreadyExistsError("exists")
+
+    cli.onecmd_plus_hooks("set address-object db1 ip-netmask 10.0.0.1/32 tags prod,web")
+
+    expected = (("Texas", "db1", "ip", "10.0.0.1/32"), {"description": None, "tags": ["prod", "web"]})
+    assert mock_sdk_client.create_address_object.call_args == expected
+    assert mock_sdk_client.update_address_object.call_args == expected
+    assert "db1" in cli.state.known_address_objects["Texas"]
+
+
 @pytest.mark.skip(reason="This test needs to be rewritten to work with cmd2 arg parsing")
 def test_show_address_object(cli_with_sdk):
     """Test showing an address object."""
@@ -182,7 +230,7 @@ def test_folder_completer(cli_with_sdk):
     cli.state.username = "developer"
     
     # Add some folders to known_folders
-    cli.state.known_folders = {"Texas", "California", "New_York"}
+    cli.state.known_folders = NameIndex({"Texas", "California", "New_York"})
     
     # Complete with no text
     completions = cli.folder_completer("", "", 0, 0)
@@ -197,6 +245,28 @@ def test_folder_completer(cli_with_sdk):
     assert "California" not in completions
 
 
+def test_name_index_complete():
+    """Test prefix completion and maintenance of the name index."""
+    index = NameIndex(["web-2", "db-1", "web-1"])
+    
+    # Complete with no text returns everything in sorted order
+    assert index.complete("") == ["db-1", "web-1", "web-2"]
+    
+    # Complete with text
+    assert index.complete("web") == ["web-1", "web-2"]
+    assert index.complete("x") == []
+    
+    # Adding and removing names keeps the index sorted
+    index.add("app-1")
+    index.update(["web-3", "db-1"])
+    index.discard("web-1")
+    index.discard("missing")
+    assert list(index) == ["app-1", "db-1", "web-2", "web-3"]
+    assert "web-2" in index
+    assert "web-1" not in index
+    assert len(index) == 4
+
+
 def test_address_type_completer(cli_with_sdk):
     """Test address type completion."""
     cli, _ = cli_with_sdk
@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from dotenv import dotenv_values
 
 from scm_cli.config import SCMConfig, load_oauth_credentials
 
@@ -112,4 +113,33 @@ def test_load_oauth_credentials_empty_variables(tmp_path):
         assert config is not None
         
         # Empty client_id should get a default value
-        assert config.client_id == "test_client_id"
\ No newline at end of file
+        assert config.client_id == "test_client_id"
+
+
+def test_load_oauth_credentials_environment_precedence(env_file):
+    """Test that set variables win over the .env file, which leaves os.environ alone."""
+    with patch("scm_cli.config.Path") as mock_path, \
+         patch.dict(os.environ, {"SCM_TSG_ID": "env_tsg_id"}, clear=True):
+        mock_path.return_value = env_file
+        
+        success, config = load_oauth_credentials()
+        
+        assert success is True
+        assert config.client_id == "test_client_id"
+        assert config.tsg_id == "env_tsg_id"
+        assert "SCM_CLIENT_ID" not in os.environ
+
+
+def test_load_oauth_credentials_reparses_changed_file(env_file):
+    """Test that the .env file is parsed once and again only after it changes."""
+    with patch("scm_cli.config.Path") as mock_path, \
+         patch("scm_cli.config.dotenv_values", wraps=dotenv_values) as mock_parse:
+        mock_path.return_value = env_file
+        
+        assert load_oauth_credentials()[1].tsg_id == "test_tsg_id"
+        assert load_oauth_credentials()[1].tsg_id == "test_tsg_id"
+        assert mock_parse.call_count == 1
+        
+        env_file.write_text("SCM_TSG_ID=changed_tsg_id\n")
+        assert load_oauth_credentials()[1].tsg_id == "changed_tsg_id"
+        assert mock_parse.call_count == 2
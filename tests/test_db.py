@@ -0,0 +1,185 @@
+"""Tests for the history database."""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from scm_cli.db import CLIHistoryDB
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    """Create a history database in a temporary directory."""
+    db = CLIHistoryDB(str(tmp_path / "history.db"))
+    yield db
+    db.close()
+
+
+def test_history_round_trip(history_db, tmp_path):
+    """Test that recorded commands can be read back and survive reopening."""
+    first = history_db.add_command("show address-object web1", "ok", "Texas")
+    second = history_db.add_command("bad command", "error", success=False)
+
+    items, total = history_db.get_history()
+    assert total == 2
+    assert [item[0] for item in items] == [second, first]
+    assert history_db.get_history_entry(first) == (
+        first, items[1][1], "show address-object web1", "ok", "Texas", True
+    )
+    assert history_db.get_history_entry(second)[5] is False
+
+    history_db.close()
+    reopened = CLIHistoryDB(str(tmp_path / "history.db"))
+    try:
+        assert reopened.get_history(folder="Texas")[1] == 1
+        reopened.clear_history()
+        assert reopened.get_history() == ([], 0)
+    finally:
+        reopened.close()
+
+
+def test_history_use_after_close_is_refused(tmp_path):
+    """Test that a closed database refuses further use but can be closed again."""
+    db = CLIHistoryDB(str(tmp_path / "history.db"))
+    db.close()
+    db.close()
+    with pytest.raises(sqlite3.ProgrammingError, match="is closed"):
+        db.add_command("cmd 1")
+    with pytest.raises(sqlite3.ProgrammingError, match="is closed"):
+        db.get_history()
+
+
+def test_history_writes_are_batched(history_db, tmp_path):
+    """Test that commands are buffered until a batch fills or history is read."""
+    other = CLIHistoryDB(str(tmp_path / "history.db"))
+    try:
+        with patch("scm_cli.db.HISTORY_FLUSH_SIZE", 3):
+            ids = [history_db.add_command(f"cmd {i}") for i in range(2)]
+            assert other.get_history()[1] == 0
+
+            ids.append(history_db.add_command("cmd 2"))
+            assert other.get_history()[1] == 3
+
+        ids.append(history_db.add_command("cmd 3"))
+        assert [item[0] for item in history_db.get_history()[0]] == ids[::-1]
+    finally:
+        other.close()
+
+
+def test_history_ids_restart_after_clear_and_survive_collisions(history_db, tmp_path):
+    """Test that clearing restarts IDs and concurrent sessions do not lose commands."""
+    history_db.add_command("cmd 1")
+    history_db.add_command("cmd 1b")
+    history_db.flush()
+    history_db.clear_history()
+    assert history_db.add_command("cmd 2") == 1
+    history_db.flush()
+
+    # Another session that started earlier hands out the same next ID
+    other = CLIHistoryDB(str(tmp_path / "history.db"))
+    try:
+        other.add_command("other")
+        other.flush()
+        history_db.add_command("cmd 3")
+        commands = sorted(item[2] for item in history_db.get_history()[0])
+        assert commands == ["cmd 2", "cmd 3", "other"]
+
+        # After renumbering, IDs carry on past the other session's records
+        next_id = history_db.add_command("cmd 4")
+        history_db.flush()
+        assert history_db.get_history_entry(next_id)[2] == "cmd 4"
+        assert history_db.get_history()[1] == 4
+    finally:
+        other.close()
+
+
+def test_history_write_failure_keeps_buffered_commands(history_db, tmp_path):
+    """Test that a locked database neither loses commands nor wedges the connection."""
+    history_db._conn.execute("PRAGMA busy_timeout = 0")
+    record_id = history_db.add_command("cmd 1")
+
+    locker = sqlite3.connect(str(tmp_path / "history.db"), isolation_level=None)
+    try:
+        locker.execute("BEGIN IMMEDIATE")
+        with pytest.raises(sqlite3.OperationalError):
+            history_db.flush()
+        assert not history_db._conn.in_transaction
+        locker.execute("ROLLBACK")
+    finally:
+        locker.close()
+
+    history_db.flush()
+    assert history_db.get_history_entry(record_id)[2] == "cmd 1"
+
+
+def test_history_failed_clear_keeps_buffered_commands(history_db, tmp_path):
+    """Test that a clear that cannot take the write lock leaves history intact."""
+    history_db._conn.execute("PRAGMA busy_timeout = 0")
+    history_db.add_command("cmd 1")
+    history_db.flush()
+    record_id = history_db.add_command("cmd 2")
+
+    locker = sqlite3.connect(str(tmp_path / "history.db"), isolation_level=None)
+    try:
+        locker.execute("BEGIN IMMEDIATE")
+        with pytest.raises(sqlite3.OperationalError):
+            history_db.clear_history()
+        locker.execute("ROLLBACK")
+    finally:
+        locker.close()
+
+    assert history_db.get_history()[1] == 2
+    assert history_db.get_history_entry(record_id)[2] == "cmd 2"
+    assert history_db.add_command("cmd 3") == record_id + 1
+
+
+def test_history_keyset_pages_match_offset_pages(history_db):
+    """Test that seeking past the previous page returns the same page as skipping."""
+    for i in range(7):
+        history_db.add_command(f"show address-object web{i}", folder="Texas" if i % 2 else None)
+
+    for folder in (None, "Texas"):
+        page1, total = history_db.get_history(limit=2, folder=folder)
+        page2, _ = history_db.get_history(limit=2, page=2, folder=folder)
+        keyset, keyset_total = history_db.get_history(
+            limit=2, folder=folder, before_id=page1[-1][0]
+        )
+        assert keyset == page2
+        assert keyset_total == total
+
+
+def test_history_count_is_cached_until_commands_change(history_db):
+    """Test that the matching count is reused until history changes."""
+    history_db.add_command("show address-objects", folder="Texas")
+    assert history_db.get_history(folder="Texas")[1] == 1
+
+    # Rows inserted behind the cache's back are not counted...
+    history_db._conn.execute(
+        "INSERT INTO command_history (timestamp, command, folder, success) "
+        "VALUES ('now', 'configure', 'Texas', 1)"
+    )
+    assert history_db.get_history(folder="Texas")[1] == 1
+
+    # ...until a command is recorded or history is cleared
+    history_db.add_command("exit", folder="Texas")
+    assert history_db.get_history(folder="Texas")[1] == 3
+    history_db.clear_history()
+    assert history_db.get_history(folder="Texas")[1] == 0
+
+
+def test_history_data_version_tracks_other_sessions(history_db, tmp_path):
+    """Test that the data version changes only when another session writes."""
+    version = history_db.data_version()
+    history_db.add_command("cmd 1")
+    history_db.flush()
+    assert history_db.data_version() == version
+
+    other = CLIHistoryDB(str(tmp_path / "history.db"))
+    try:
+        other.add_command("other")
+        other.flush()
+    finally:
+        other.close()
+    assert history_db.data_version() != version
+    assert history_db.get_history()[1] == 2
@@ -0,0 +1,296 @@
+"""Tests for the SDK client."""
+
+from unittest.mock import patch
+
+import pytest
+
+from scm_cli.config import SCMConfig
+from scm_cli.mock_sdk import (
+    AddressObject,
+    AddressObjectType,
+    ResourceAlreadyExistsError,
+    ResourceNotFoundError,
+)
+from scm_cli.sdk_client import SDKClient, _build_client
+
+
+@pytest.fixture
+def sdk_client():
+    """Create an SDK client backed by a fresh mock SDK client."""
+    _build_client.cache_clear()
+    config = SCMConfig(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        tsg_id="test_tsg_id",
+    )
+    return SDKClient(config)
+
+
+def test_list_address_objects_reuses_listing(sdk_client):
+    """Test that a recent folder listing is reused until the folder changes."""
+    sdk_client.create_address_object("Texas", "web1", "fqdn", "web1.example.com")
+
+    with patch.object(
+        sdk_client.client.address_objects,
+        "list",
+        wraps=sdk_client.client.address_objects.list,
+    ) as mock_list:
+        # Repeated listings and lookups are served from one API call
+        assert [a.name for a in sdk_client.list_address_objects("Texas")] == ["web1"]
+        assert [a.name for a in sdk_client.list_address_objects("Texas")] == ["web1"]
+        assert sdk_client.get_address_object("Texas", "web1").value == "web1.example.com"
+        assert mock_list.call_count == 1
+
+        # Modifying the folder invalidates the cached listing
+        sdk_client.create_address_object("Texas", "web2", "fqdn", "web2.example.com")
+        names = [a.name for a in sdk_client.list_address_objects("Texas")]
+        assert sorted(names) == ["web1", "web2"]
+        assert mock_list.call_count == 2
+
+
+def test_list_address_objects_filters(sdk_client):
+    """Test that every filter criterion must match, case-insensitively."""
+    sdk_client.create_address_object(
+        "Texas", "web1", "fqdn", "web1.example.com", tags=["Prod"]
+    )
+    sdk_client.create_address_object(
+        "Texas", "db1", "ip", "10.0.0.1/32", tags=["prod", "db"]
+    )
+    sdk_client.create_address_object("Texas", "web2", "fqdn", "web2.example.com")
+
+    def names(filter_criteria):
+        addresses = sdk_client.list_address_objects("Texas", filter_criteria)
+        return sorted(a.name for a in addresses)
+
+    assert names({"name": "WEB"}) == ["web1", "web2"]
+    assert names({"type": "FQDN", "tag": "pro"}) == ["web1"]
+    assert names({"value": "10.0"}) == ["db1"]
+    assert names({"tag": "missing"}) == []
+    # A tag match never spans two tags
+    assert names({"tag": "proddb"}) == []
+    # Matching is caseless rather than just lowercased
+    sdk_client.create_address_object("Texas", "Straße", "fqdn", "strasse.example.com")
+    assert names({"name": "STRASSE"}) == ["Straße"]
+    # Unknown criteria are ignored
+    assert names({"colour": "red"}) == ["Straße", "db1", "web1", "web2"]
+
+
+def test_sdk_clients_share_client_per_config(sdk_client):
+    """Test that SDK clients built from equal configs share one SDK client."""
+    config = SCMConfig(
+        client_id="test_client_id",
+        client_secret="test_client_secret",
+        tsg_id="test_tsg_id",
+    )
+    assert SDKClient(config).client is sdk_client.client
+
+    other = SCMConfig(
+        client_id="other_client_id",
+        client_secret="test_client_secret",
+        tsg_id="test_tsg_id",
+    )
+    assert SDKClient(other).client is not sdk_client.client
+
+
+def test_update_address_object_skips_redundant_get(sdk_client):
+    """Test that updates only fetch the existing object when they need it."""
+    sdk_client.create_address_object(
+        "Texas", "web1", "fqdn", "web1.example.com", description="Web", tags=["prod"]
+    )
+
+    with patch.object(
+        sdk_client.client.address_objects,
+        "get",
+        wraps=sdk_client.client.address_objects.get,
+    ) as mock_get:
+        # Every field given: nothing to fill in from the existing object
+        sdk_client.update_address_object(
+            "Texas", "web1", "fqdn", "www.example.com", description="Web", tags=["prod"]
+        )
+        assert mock_get.call_count == 0
+
+        # Missing fields are read from the server, even when the object is
+        # cached, so changes made elsewhere are not reverted
+        sdk_client.list_address_objects("Texas")
+        sdk_client.client.address_objects.update(
+            folder="Texas",
+            address_object=AddressObject(
+                name="web1", type=AddressObjectType.FQDN, value="www.example.com",
+                description="Edited elsewhere", tags=["prod"],
+            ),
+        )
+        address = sdk_client.update_address_object("Texas", "web1", "fqdn", "web.example.com")
+        assert (address.description, address.tags) == ("Edited elsewhere", ["prod"])
+        assert mock_get.call_count == 1
+
+    with pytest.raises(ResourceNotFoundError):
+        sdk_client.update_address_object(
+            "Texas", "missing", "fqdn", "x.example.com", description="", tags=[]
+        )
+
+
+def test_test_connection_reuses_success(sdk_client):
+    """Test that a successful connection test is reused and failures are not."""
+    with patch.object(
+        sdk_client.client, "test_connection", side_effect=[False, True]
+    ) as mock_test:
+        assert sdk_client.test_connection() is False
+        assert sdk_client.test_connection() is True
+        assert sdk_client.test_connection() is True
+        assert mock_test.call_count == 2
+
+
+def test_bulk_list_and_get(sdk_client):
+    """Test listing several folders and getting several objects at once."""
+    sdk_client.create_address_object("Texas", "web1", "fqdn", "web1.example.com")
+    sdk_client.create_address_object("Austin", "db1", "ip", "10.0.0.1/32")
+
+    listings = sdk_client.list_address_objects_many(["Texas", "Austin", "Dallas"])
+    assert {folder: [a.name for a in addrs] for folder, addrs in listings.items()} == {
+        "Texas": ["web1"],
+        "Austin": ["db1"],
+        "Dallas": [],
+    }
+
+    addresses = sdk_client.get_address_objects([("Austin", "db1"), ("Texas", "web1")])
+    assert [a.name for a in addresses] == ["db1", "web1"]
+
+    # A failure is reported in place without stopping the other items
+    addresses = sdk_client.get_address_objects([("Texas", "web1"), ("Texas", "missing")])
+    assert addresses[0].name == "web1"
+    assert isinstance(addresses[1], ResourceNotFoundError)
+
+
+def test_delete_address_objects(sdk_client):
+    """Test deleting several address objects at once."""
+    for name in ("web1", "web2"):
+        sdk_client.create_address_object("Texas", name, "fqdn", f"{name}.example.com")
+
+    results = sdk_client.delete_address_objects(
+        [("Texas", "web1"), ("Texas", "missing"), ("Texas", "web2")]
+    )
+    assert results[0] is None and results[2] is None
+    assert isinstance(results[1], ResourceNotFoundError)
+    assert sdk_client.list_address_objects("Texas") == []
+
+
+def test_get_address_object_reuses_fetched_object(sdk_client):
+    """Test that fetched objects are reused until they are deleted."""
+    sdk_client.client.address_objects.create(
+        folder="Texas",
+        address_object=AddressObject(
+            name="web1", type=AddressObjectType.FQDN, value="web1.example.com"
+        ),
+    )
+
+    with patch.object(
+        sdk_client.client.address_objects,
+        "get",
+        wraps=sdk_client.client.address_objects.get,
+    ) as mock_get:
+        assert sdk_client.get_address_object("Texas", "web1").value == "web1.example.com"
+        assert sdk_client.get_address_object("Texas", "web1").value == "web1.example.com"
+        assert mock_get.call_count == 1
+
+        sdk_client.delete_address_object("Texas", "web1")
+        with pytest.raises(ResourceNotFoundError):
+            sdk_client.get_address_object("Texas", "web1")
+        assert mock_get.call_count == 2
+
+
+def test_update_address_objects(sdk_client):
+    """Test updating several address objects at once."""
+    for name in ("web1", "web2"):
+        sdk_client.create_address_object("Texas", name, "fqdn", f"{name}.example.com")
+
+    updated = sdk_client.update_address_objects(
+        [
+            {"folder": "Texas", "name": "web1", "type_val": "fqdn", "value": "a.example.com"},
+            {"folder": "Texas", "name": "web2", "type_val": "fqdn", "value": "b.example.com"},
+        ]
+    )
+    assert [(a.name, a.value) for a in updated] == [
+        ("web1", "a.example.com"),
+        ("web2", "b.example.com"),
+    ]
+    assert sdk_client.get_address_object("Texas", "web2").value == "b.example.com"
+
+    # A failure is reported in place without stopping the other changes
+    updated = sdk_client.update_address_objects(
+        [
+            {"folder": "Texas", "name": "missing", "type_val": "fqdn", "value": "x.example.com"},
+            {"folder": "Texas", "name": "web1", "type_val": "fqdn", "value": "c.example.com"},
+        ]
+    )
+    assert isinstance(updated[0], ResourceNotFoundError)
+    assert updated[1].value == "c.example.com"
+
+    # Concurrent changes to one name share its cache entry without failing
+    updated = sdk_client.update_address_objects(
+        [
+            {"folder": "Texas", "name": "web1", "type_val": "fqdn", "value": f"{i}.example.com"}
+            for i in range(32)
+        ]
+    )
+    assert all(isinstance(address, AddressObject) for address in updated)
+
+
+def test_object_cache_is_bounded(sdk_client):
+    """Test that the object cache drops its least recently used entries."""
+    with patch("scm_cli.sdk_client.OBJECT_CACHE_SIZE", 2):
+        for name in ("web1", "web2"):
+            sdk_client.create_address_object("Texas", name, "fqdn", f"{name}.example.com")
+        sdk_client.get_address_object("Texas", "web1")
+        sdk_client.create_address_object("Texas", "web3", "fqdn", "web3.example.com")
+
+    assert list(sdk_client._object_cache) == [("Texas", "web1"), ("Texas", "web3")]
+
+
+def test_address_object_exists_uses_primed_index(sdk_client):
+    """Test that existence checks are answered from a primed folder listing."""
+    sdk_client.create_address_object("Texas", "web1", "fqdn", "web1.example.com")
+    sdk_client.prime_address_index("Texas")
+
+    with patch.object(sdk_client.client.address_objects, "get") as mock_get:
+        assert sdk_client.address_object_exists("Texas", "web1") is True
+        assert sdk_client.address_object_exists("Texas", "web2") is False
+        assert mock_get.call_count == 0
+
+    # Without a listing, the object is looked up
+    assert sdk_client.address_object_exists("Austin", "web1") is False
+
+
+def test_create_address_objects(sdk_client):
+    """Test creating several address objects at once."""
+    created = sdk_client.create_address_objects(
+        [
+            {"folder": "Texas", "name": "web1", "type_val": "fqdn", "value": "web1.example.com"},
+            {"folder": "Austin", "name": "db1", "type_val": "ip", "value": "10.0.0.1/32"},
+        ]
+    )
+    assert [a.name for a in created] == ["web1", "db1"]
+    assert sdk_client.address_object_exists("Austin", "db1") is True
+
+    # A failure is reported in place without stopping the other items
+    created = sdk_client.create_address_objects(
+        [
+            {"folder": "Texas", "name": "web1", "type_val": "fqdn", "value": "web1.example.com"},
+            {"folder": "Texas", "name": "web2", "type_val": "fqdn", "value": "web2.example.com"},
+        ]
+    )
+    assert isinstance(created[0], ResourceAlreadyExistsError)
+    assert created[1].name == "web2"
+    assert sdk_client.address_object_exists("Texas", "web2") is True
+
+    # Creates racing on one name report the server's outcome, never a cache error
+    created = sdk_client.create_address_objects(
+        [
+            {"folder": "Texas", "name": "web3", "type_val": "fqdn", "value": "web3.example.com"}
+            for _ in range(2)
+        ]
+    )
+    assert any(isinstance(result, AddressObject) for result in created)
+    assert all(
+        isinstance(result, (AddressObject, ResourceAlreadyExistsError))
+        for result in created
+    )